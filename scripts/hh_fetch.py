@@ -13,9 +13,13 @@ Usage examples:
 
 Defaults:
   - Saves CSV into ./output/hh_vacancies_<timestamp>.csv
-  - Optional Parquet output with --parquet (requires pandas+pyarrow)
-  - Optional per-vacancy details enrichment with --details
-  - Respects API pagination; backs off on HTTP 429/5xx
+  - Optional Parquet output with --parquet (requires pyarrow)
+  - Optional per-vacancy details enrichment with --details; description HTML goes to
+    a sibling <csv name>.descriptions.jsonl.gz keyed by vacancy id
+  - Detail payloads are cached in ./output/.hh_detail_cache and reused on re-runs
+  - Crawls every (area, date window) pair, their pages and details concurrently, up to
+    --concurrency requests in flight; rows are written in completion order
+  - Respects API pagination; paces requests adaptively and backs off on HTTP 429/5xx
 
 Notes:
   - Provide a meaningful User-Agent with a contact for good citizenship.
@@ -25,25 +29,102 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
 import csv
+import gzip
+import importlib.util
 import os
+import random
+import shelve
 import sys
-import time
 import datetime as dt
-from typing import Dict, Any, Iterable, List, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple, Union
 
 try:
-    import requests  # type: ignore
+    import httpx  # type: ignore
 except Exception as exc:
     sys.stderr.write(
-        "requests is required. Install with: pip install requests\n"
+        "httpx is required. Install with: pip install 'httpx[http2]'\n"
     )
     raise
 
+try:
+    import msgspec  # type: ignore
+except Exception as exc:
+    sys.stderr.write(
+        "msgspec is required. Install with: pip install msgspec\n"
+    )
+    raise
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    import json as orjson  # type: ignore
+
 
 API_URL = "https://api.hh.ru/vacancies"
 
 
+# Typed shape of the /vacancies search response. Pages decode straight into these
+# structs; fields not listed here are skipped by the decoder. IDs are documented as
+# strings but accepted as numbers too, and normalised to str.
+class Named(msgspec.Struct):
+    id: Optional[Union[str, int]] = None
+    name: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.id is not None:
+            self.id = str(self.id)
+
+
+class Salary(msgspec.Struct):
+    # hh.ru documents salary bounds as `number`, so fractional values are possible
+    from_: Optional[Union[int, float]] = msgspec.field(default=None, name="from")
+    to: Optional[Union[int, float]] = None
+    currency: Optional[str] = None
+    gross: Optional[bool] = None
+
+
+class Snippet(msgspec.Struct):
+    requirement: Optional[str] = None
+    responsibility: Optional[str] = None
+
+
+class Vacancy(msgspec.Struct):
+    id: Optional[Union[str, int]] = None
+    name: Optional[str] = None
+    alternate_url: Optional[str] = None
+    published_at: Optional[str] = None
+    employer: Optional[Named] = None
+    area: Optional[Named] = None
+    salary: Optional[Salary] = None
+    schedule: Optional[Named] = None
+    employment: Optional[Named] = None
+    snippet: Optional[Snippet] = None
+
+    def __post_init__(self) -> None:
+        if self.id is not None:
+            self.id = str(self.id)
+
+
+class VacancyPage(msgspec.Struct):
+    items: List[Vacancy] = msgspec.field(default_factory=list)
+    pages: int = 0
+
+
+# The envelope keeps items undecoded so each one is validated on its own: a single
+# malformed item costs one row, not the page (or, on page 0, the page count).
+class RawVacancyPage(msgspec.Struct):
+    items: List[msgspec.Raw] = msgspec.field(default_factory=list)
+    pages: Any = 0
+
+
+RAW_PAGE_DECODER = msgspec.json.Decoder(RawVacancyPage)
+# lax mode also accepts numbers and bools sent as strings (e.g. "gross": "true")
+VACANCY_DECODER = msgspec.json.Decoder(Vacancy, strict=False)
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Fetch vacancies from hh.ru API and save to CSV")
     parser.add_argument("--text", required=False, default="", help="Search text (query). Optional")
@@ -73,7 +154,28 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Schedule filter(s), comma-separated. Examples: fullDay,shift,flexible,remote,flyInFlyOut",
     )
-    parser.add_argument("--delay", type=float, default=0.5, help="Delay between requests in seconds")
+    parser.add_argument(
+        "--only-with-salary",
+        action="store_true",
+        help="Only vacancies with a salary specified (filtered server-side)",
+    )
+    parser.add_argument(
+        "--search-field",
+        default=None,
+        help="Restrict --text matching to these field(s), comma-separated: name,company_name,description",
+    )
+    parser.add_argument(
+        "--delay",
+        type=float,
+        default=0.1,
+        help="Initial delay between requests in seconds; adapts to server responses (default: 0.1)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Max API requests in flight at once (default: 8)",
+    )
     parser.add_argument(
         "--out",
         default=None,
@@ -82,7 +184,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--parquet",
         action="store_true",
-        help="Also save results to Parquet (requires pandas & pyarrow)",
+        help="Also save results to Parquet (requires pyarrow)",
     )
     parser.add_argument(
         "--parquet-out",
@@ -94,6 +196,16 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Fetch /vacancies/{id} for richer fields (slower)",
     )
+    parser.add_argument(
+        "--detail-cache",
+        default=os.path.join("output", ".hh_detail_cache"),
+        help="On-disk cache of --details payloads, reused across runs. Default: ./output/.hh_detail_cache",
+    )
+    parser.add_argument(
+        "--no-detail-cache",
+        action="store_true",
+        help="Always fetch details from the API, bypassing the cache",
+    )
     parser.add_argument(
         "--user-agent",
         default="GlossaryMetricsVacFetcher/1.0 (+contact: your-email@example.com)",
@@ -102,153 +214,390 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+# directories already created in this process
+_created_dirs: set[str] = set()
+
+
+def ensure_dir(directory: str) -> None:
+    if directory not in _created_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _created_dirs.add(directory)
+
+
 def ensure_output_path(out_path: Optional[str]) -> str:
     if out_path:
-        directory = os.path.dirname(out_path) or "."
-        os.makedirs(directory, exist_ok=True)
+        ensure_dir(os.path.dirname(out_path) or ".")
         return out_path
     timestamp = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
     out_dir = os.path.join("output")
-    os.makedirs(out_dir, exist_ok=True)
+    ensure_dir(out_dir)
     return os.path.join(out_dir, f"hh_vacancies_{timestamp}.csv")
 
 
-def request_with_backoff(url: str, params: Dict[str, Any], headers: Dict[str, str], max_retries: int = 5) -> requests.Response:
-    backoff = 1.0
+def make_client(user_agent: str, limit: int = 16) -> httpx.AsyncClient:
+    """Build a keep-alive client shared by all API calls; HTTP/2 multiplexes them over one connection."""
+    return httpx.AsyncClient(
+        # HTTP/2 needs the optional h2 package; without it httpx speaks HTTP/1.1
+        http2=importlib.util.find_spec("h2") is not None,
+        headers={
+            "User-Agent": user_agent,
+            "HH-User-Agent": user_agent,
+            "Accept": "application/json",
+        },
+        timeout=30,
+        limits=httpx.Limits(max_connections=limit),
+        # httpx does not follow redirects by default, unlike requests/aiohttp
+        follow_redirects=True,
+    )
+
+
+class AdaptivePacer:
+    """Spaces out requests, widening the interval on 429/5xx and narrowing it on success (AIMD)."""
+
+    def __init__(self, interval: float = 0.1, min_interval: float = 0.05, max_interval: float = 30.0) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min(max(interval, min_interval), max_interval)
+        self._next_at = 0.0
+
+    async def wait(self) -> None:
+        # reserve the next free slot so concurrent callers stay `interval` apart
+        now = asyncio.get_running_loop().time()
+        start_at = max(now, self._next_at)
+        self._next_at = start_at + self.interval
+        await asyncio.sleep(start_at - now)
+
+    def on_success(self) -> None:
+        self.interval = max(self.min_interval, self.interval * 0.9)
+
+    def on_throttle(self, retry_after: Optional[str] = None) -> None:
+        self.interval = min(self.max_interval, self.interval * 2)
+        if retry_after:
+            try:
+                hold = float(retry_after)
+            except ValueError:
+                return
+            resume_at = asyncio.get_running_loop().time() + min(hold, self.max_interval)
+            self._next_at = max(self._next_at, resume_at)
+
+
+def backoff_delay(headers: Any, attempt: int, base: float = 1.0, jitter: float = 0.5) -> float:
+    """Seconds to wait before retrying: the server's Retry-After if given, else jittered exponential."""
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), 30.0)
+        except ValueError:
+            pass
+    return min(30.0, base * (2 ** attempt) * (1 + jitter * random.random()))
+
+
+async def request_with_backoff(
+    client: httpx.AsyncClient,
+    pacer: AdaptivePacer,
+    url: str,
+    params: Dict[str, Any],
+    max_retries: int = 5,
+) -> bytes:
     for attempt in range(max_retries):
-        resp = requests.get(url, params=params, headers=headers, timeout=30)
-        if resp.status_code == 200:
-            return resp
-        if resp.status_code in (429, 500, 502, 503, 504):
-            time.sleep(backoff)
-            backoff = min(backoff * 2, 30.0)
+        await pacer.wait()
+        try:
+            resp = await client.get(url, params=params)
+        except httpx.TransportError:
+            # timeouts, refused connections and HTTP/2 resets are transient: retry like a 5xx
+            pacer.on_throttle()
+            if attempt + 1 >= max_retries:
+                raise
+            await asyncio.sleep(backoff_delay({}, attempt))
             continue
-        resp.raise_for_status()
+        if resp.status_code == 200:
+            pacer.on_success()
+            return resp.content
+        if resp.status_code not in (429, 500, 502, 503, 504):
+            resp.raise_for_status()
+        pacer.on_throttle(resp.headers.get("Retry-After"))
+        if attempt + 1 < max_retries:
+            await asyncio.sleep(backoff_delay(resp.headers, attempt))
     # last try
     resp.raise_for_status()
-    return resp  # for type checker
+    return b""  # for type checker
 
 
-def get_detail_with_backoff(vacancy_id: str, headers: Dict[str, str], max_retries: int = 5) -> Optional[Dict[str, Any]]:
-    url = f"https://api.hh.ru/vacancies/{vacancy_id}"
-    backoff = 1.0
-    for _ in range(max_retries):
-        r = requests.get(url, headers=headers, timeout=30)
+async def get_detail_with_backoff(
+    client: httpx.AsyncClient,
+    pacer: AdaptivePacer,
+    vacancy_id: str,
+    max_retries: int = 5,
+) -> Optional[Dict[str, Any]]:
+    url = f"{API_URL}/{vacancy_id}"
+    for attempt in range(max_retries):
+        await pacer.wait()
+        try:
+            r = await client.get(url)
+        except httpx.TransportError:
+            # timeouts, refused connections and HTTP/2 resets are transient: retry like a 5xx
+            pacer.on_throttle()
+            if attempt + 1 >= max_retries:
+                # still failing: give up for this vacancy only
+                return None
+            await asyncio.sleep(backoff_delay({}, attempt))
+            continue
         if r.status_code == 200:
+            pacer.on_success()
             try:
-                return r.json()
+                return orjson.loads(r.content)
             except Exception:
                 return None
-        if r.status_code in (429, 500, 502, 503, 504):
-            time.sleep(backoff)
-            backoff = min(backoff * 2, 30.0)
-            continue
-        # other errors: give up for this vacancy only
-        return None
+        if r.status_code not in (429, 500, 502, 503, 504):
+            # other errors: give up for this vacancy only
+            return None
+        pacer.on_throttle(r.headers.get("Retry-After"))
+        if attempt + 1 < max_retries:
+            await asyncio.sleep(backoff_delay(r.headers, attempt))
     return None
 
 
-def iter_vacancies(
+async def fetch_page(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    pacer: AdaptivePacer,
+    params: Dict[str, Any],
+) -> VacancyPage:
+    async with sem:
+        content = await request_with_backoff(client, pacer, API_URL, params=params)
+    try:
+        raw = RAW_PAGE_DECODER.decode(content)
+    except msgspec.ValidationError as exc:
+        # one malformed page should not abort every concurrent crawl
+        sys.stderr.write(f"Skipping page {params.get('page')} for area {params.get('area')}: {exc}\n")
+        return VacancyPage()
+    try:
+        pages = int(raw.pages or 0)
+    except (TypeError, ValueError):
+        pages = 0
+    items: List[Vacancy] = []
+    for index, raw_item in enumerate(raw.items):
+        try:
+            items.append(VACANCY_DECODER.decode(raw_item))
+        except msgspec.ValidationError as exc:
+            sys.stderr.write(
+                f"Skipping item {index} on page {params.get('page')} for area {params.get('area')}: {exc}\n"
+            )
+    return VacancyPage(items=items, pages=pages)
+
+
+async def fetch_details(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    pacer: AdaptivePacer,
+    items: List[Vacancy],
+    cache: Optional[shelve.Shelf] = None,
+) -> List[Optional[Dict[str, Any]]]:
+    async def fetch_one(item: Vacancy) -> Optional[Dict[str, Any]]:
+        if not item.id:
+            return None
+        vid = item.id
+        # a re-published vacancy gets a new key, so stale payloads are never served
+        key = f"{vid}:{item.published_at}"
+        if cache is not None and key in cache:
+            return cache[key]
+        async with sem:
+            detail = await get_detail_with_backoff(client, pacer, vid)
+        if cache is not None and detail is not None:
+            cache[key] = detail
+        return detail
+
+    return await asyncio.gather(*[fetch_one(item) for item in items])
+
+
+async def iter_vacancy_pages(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    pacer: AdaptivePacer,
     query_text: str,
-    area_ids: List[str],
+    area: str,
     per_page: int,
-    user_agent: str,
     date_from: Optional[str],
     date_to: Optional[str],
-    delay: float,
     max_pages: Optional[int],
     employment_filters: Optional[List[str]] = None,
     schedule_filters: Optional[List[str]] = None,
-) -> Iterable[Dict[str, Any]]:
-    headers = {
-        "User-Agent": user_agent,
-        "HH-User-Agent": user_agent,
-        "Accept": "application/json",
+    only_with_salary: bool = False,
+    search_fields: Optional[List[str]] = None,
+) -> AsyncIterator[List[Vacancy]]:
+    """Yield each page's items; pages after the first are fetched concurrently."""
+    params: Dict[str, Any] = {
+        "area": area,
+        "per_page": per_page,
     }
-    for area in area_ids:
-        page = 0
-        total_pages_for_area: Optional[int] = None
-        while True:
-            if max_pages is not None and page > max_pages:
-                break
-            params: Dict[str, Any] = {
-                "area": area,
-                "per_page": per_page,
-                "page": page,
-            }
-            if query_text.strip():
-                params["text"] = query_text.strip()
-            if date_from:
-                params["date_from"] = date_from
-            if date_to:
-                params["date_to"] = date_to
-            # filters
-            if employment_filters:
-                params["employment"] = employment_filters
-            if schedule_filters:
-                params["schedule"] = schedule_filters
-
-            resp = request_with_backoff(API_URL, params=params, headers=headers)
-            data = resp.json()
-
-            if total_pages_for_area is None:
-                try:
-                    total_pages_for_area = int(data.get("pages", 0))
-                except Exception:
-                    total_pages_for_area = 0
-
-            for item in data.get("items", []):
-                yield item
-
-            page += 1
-            if total_pages_for_area is not None and page >= total_pages_for_area:
-                break
-            time.sleep(delay)
-
-
-def flatten_item(item: Dict[str, Any], detail: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    salary = item.get("salary") or {}
-    employer = item.get("employer") or {}
-    area = item.get("area") or {}
-    snippet = item.get("snippet") or {}
-
-    detail_desc_html: Optional[str] = None
+    if query_text.strip():
+        params["text"] = query_text.strip()
+    if date_from:
+        params["date_from"] = date_from
+    if date_to:
+        params["date_to"] = date_to
+    # filters
+    if employment_filters:
+        params["employment"] = employment_filters
+    if schedule_filters:
+        params["schedule"] = schedule_filters
+    if only_with_salary:
+        params["only_with_salary"] = "true"
+    if search_fields:
+        params["search_field"] = search_fields
+
+    # page 0 tells us how many pages there are; the rest are fetched concurrently
+    first = await fetch_page(client, sem, pacer, {**params, "page": 0})
+    last_page = first.pages - 1
+    if max_pages is not None:
+        last_page = min(last_page, max_pages)
+
+    yield first.items
+
+    rest = await asyncio.gather(
+        *[fetch_page(client, sem, pacer, {**params, "page": page}) for page in range(1, last_page + 1)]
+    )
+    for data in rest:
+        yield data.items
+
+
+# CSV/Parquet column order; flatten_item returns values in exactly this order
+FIELDNAMES = [
+    "id",
+    "name",
+    "alternate_url",
+    "employer_id",
+    "employer_name",
+    "area_id",
+    "area_name",
+    "salary_from",
+    "salary_to",
+    "salary_currency",
+    "salary_gross",
+    "published_at",
+    "schedule",
+    "employment",
+    "requirement",
+    "responsibility",
+    "detail_key_skills",
+    "detail_professional_roles",
+]
+
+
+# shared stand-ins for missing nested objects; read-only, never mutate
+_NO_NAMED = Named()
+_NO_SALARY = Salary()
+_NO_SNIPPET = Snippet()
+
+
+def dumps_line(obj: Any) -> bytes:
+    data = orjson.dumps(obj)
+    if isinstance(data, str):  # stdlib json fallback
+        data = data.encode("utf-8")
+    return data + b"\n"
+
+
+def flatten_item(item: Vacancy, detail: Optional[Dict[str, Any]] = None) -> Tuple[Any, ...]:
+    salary = item.salary or _NO_SALARY
+    employer = item.employer or _NO_NAMED
+    area = item.area or _NO_NAMED
+    snippet = item.snippet or _NO_SNIPPET
+    schedule = item.schedule or _NO_NAMED
+    employment = item.employment or _NO_NAMED
+
     detail_key_skills: Optional[str] = None
     detail_prof_roles: Optional[str] = None
     if detail:
-        detail_desc_html = detail.get("description")
         ks = detail.get("key_skills") or []
         if isinstance(ks, list):
-            detail_key_skills = ", ".join([str(x.get("name")) for x in ks if isinstance(x, dict)])
+            detail_key_skills = ", ".join(x["name"] for x in ks if isinstance(x, dict) and x.get("name"))
         pr = detail.get("professional_roles") or []
         if isinstance(pr, list):
-            detail_prof_roles = ", ".join([str(x.get("name")) for x in pr if isinstance(x, dict)])
-
-    return {
-        "id": item.get("id"),
-        "name": item.get("name"),
-        "alternate_url": item.get("alternate_url"),
-        "employer_id": employer.get("id"),
-        "employer_name": employer.get("name"),
-        "area_id": area.get("id"),
-        "area_name": area.get("name"),
-        "salary_from": salary.get("from"),
-        "salary_to": salary.get("to"),
-        "salary_currency": salary.get("currency"),
-        "salary_gross": salary.get("gross"),
-        "published_at": item.get("published_at"),
-        "schedule": (item.get("schedule") or {}).get("name"),
-        "employment": (item.get("employment") or {}).get("name"),
-        "requirement": snippet.get("requirement"),
-        "responsibility": snippet.get("responsibility"),
+            detail_prof_roles = ", ".join(x["name"] for x in pr if isinstance(x, dict) and x.get("name"))
+
+    return (
+        item.id,
+        item.name,
+        item.alternate_url,
+        employer.id,
+        employer.name,
+        area.id,
+        area.name,
+        salary.from_,
+        salary.to,
+        salary.currency,
+        salary.gross,
+        item.published_at,
+        schedule.name,
+        employment.name,
+        snippet.requirement,
+        snippet.responsibility,
         # details
-        "detail_description_html": detail_desc_html,
-        "detail_key_skills": detail_key_skills,
-        "detail_professional_roles": detail_prof_roles,
-    }
+        detail_key_skills,
+        detail_prof_roles,
+    )
 
 
-def main() -> None:
+# Parquet column types; anything not listed is stored as a string
+PARQUET_TYPES = {
+    "salary_from": "float64",
+    "salary_to": "float64",
+    "salary_gross": "bool_",
+}
+
+
+class ParquetSink:
+    """Writes rows to Parquet in fixed-size record batches, so memory stays bounded."""
+
+    def __init__(self, path: str, fieldnames: List[str], batch_size: int = 16384) -> None:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+
+        self._pa = pa
+        self.schema = pa.schema(
+            [pa.field(name, getattr(pa, PARQUET_TYPES.get(name, "string"))()) for name in fieldnames]
+        )
+        self.writer = pq.ParquetWriter(
+            path,
+            self.schema,
+            compression="zstd",
+            compression_level=3,
+            data_page_size=1 << 20,
+            use_dictionary=True,
+            write_statistics=True,
+        )
+        self.batch_size = batch_size
+        self.batch_buf: List[Tuple[Any, ...]] = []
+
+    def write_rows(self, rows: List[Tuple[Any, ...]]) -> None:
+        self.batch_buf.extend(rows)
+        while len(self.batch_buf) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.batch_buf:
+            batch, self.batch_buf = self.batch_buf[: self.batch_size], self.batch_buf[self.batch_size :]
+            pa = self._pa
+            columns = [pa.array(col, type=field.type) for col, field in zip(zip(*batch), self.schema)]
+            # each batch becomes one row group, so batch_size is also the row group size
+            self.writer.write_batch(
+                pa.RecordBatch.from_arrays(columns, schema=self.schema),
+                row_group_size=self.batch_size,
+            )
+
+    def close(self) -> None:
+        while self.batch_buf:
+            self.flush()
+        self.writer.close()
+
+    def __enter__(self) -> "ParquetSink":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+async def run() -> None:
     args = parse_args()
     out_path = ensure_output_path(args.out)
 
@@ -257,35 +606,9 @@ def main() -> None:
         sys.stderr.write("No valid areas provided.\n")
         sys.exit(2)
 
-    fieldnames = [
-        "id",
-        "name",
-        "alternate_url",
-        "employer_id",
-        "employer_name",
-        "area_id",
-        "area_name",
-        "salary_from",
-        "salary_to",
-        "salary_currency",
-        "salary_gross",
-        "published_at",
-        "schedule",
-        "employment",
-        "requirement",
-        "responsibility",
-        "detail_description_html",
-        "detail_key_skills",
-        "detail_professional_roles",
-    ]
-
     total = 0
-    rows: List[Dict[str, Any]] = []
-    headers = {
-        "User-Agent": args.user_agent,
-        "HH-User-Agent": args.user_agent,
-        "Accept": "application/json",
-    }
+    # vacancies repeat across overlapping windows/areas; keep the first, skip the rest
+    seen: set[str] = set()
     # prepare filters lists
     args_employment: Optional[List[str]] = None
     if args.employment:
@@ -293,6 +616,9 @@ def main() -> None:
     args_schedule: Optional[List[str]] = None
     if args.schedule:
         args_schedule = [x.strip() for x in args.schedule.split(",") if x.strip()]
+    args_search_field: Optional[List[str]] = None
+    if args.search_field:
+        args_search_field = [x.strip() for x in args.search_field.split(",") if x.strip()]
     # Determine date windows
     if args.last_days is not None:
         if args.date_from or args.date_to:
@@ -319,56 +645,135 @@ def main() -> None:
     else:
         windows.append((date_str(start_date), date_str(end_date)))
 
-    for (w_from, w_to) in windows:
-        for item in iter_vacancies(
-            query_text=args.text,
-            area_ids=area_ids,
-            per_page=args.per_page,
-            user_agent=args.user_agent,
-            date_from=w_from,
-            date_to=w_to,
-            delay=args.delay,
-            max_pages=args.max_pages,
-            employment_filters=args_employment,
-            schedule_filters=args_schedule,
-        ):
-            detail_obj: Optional[Dict[str, Any]] = None
-            if args.details and item.get("id"):
-                detail_obj = get_detail_with_backoff(str(item.get("id")), headers=headers)
-                time.sleep(max(args.delay, 0.25))
-            rows.append(flatten_item(item, detail=detail_obj))
-            total += 1
-
-    # CSV output
-    with open(out_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-    print(f"Saved {total} rows to {out_path}")
-
-    # Optional Parquet output
+    concurrency = max(1, args.concurrency)
+    sem = asyncio.Semaphore(concurrency)
+    pacer = AdaptivePacer(interval=args.delay)
+    parquet_path: Optional[str] = None
     if args.parquet:
         parquet_path = args.parquet_out
         if not parquet_path:
             parquet_path = os.path.splitext(out_path)[0] + ".parquet"
-        try:
-            import pandas as pd  # type: ignore
-        except Exception:
-            sys.stderr.write(
-                "pandas is required for --parquet. Install with: pip install pandas pyarrow\n"
-            )
-            return
-        df = pd.DataFrame(rows)
-        try:
-            df.to_parquet(parquet_path, index=False)
-        except Exception as exc:
-            sys.stderr.write(
-                f"Failed to write Parquet at {parquet_path}: {exc}\n"
-            )
-            return
+    descs_path: Optional[str] = None
+    if args.details:
+        descs_path = os.path.splitext(out_path)[0] + ".descriptions.jsonl.gz"
+
+    with contextlib.ExitStack() as stack:
+        # CSV output is streamed: rows hit the file as each page completes, in completion order
+        f = stack.enter_context(open(out_path, "w", newline="", encoding="utf-8"))
+
+        # Optional Parquet output, written alongside the CSV
+        pq_writer: Optional[ParquetSink] = None
+        if parquet_path:
+            try:
+                pq_writer = stack.enter_context(ParquetSink(parquet_path, FIELDNAMES))
+            except ImportError:
+                sys.stderr.write(
+                    "pyarrow is required for --parquet. Install with: pip install pyarrow\n"
+                )
+            except Exception as exc:
+                sys.stderr.write(
+                    f"Failed to write Parquet at {parquet_path}: {exc}\n"
+                )
+
+        detail_cache: Optional[shelve.Shelf] = None
+        if args.details and not args.no_detail_cache:
+            ensure_dir(os.path.dirname(args.detail_cache) or ".")
+            detail_cache = stack.enter_context(shelve.open(args.detail_cache))
+
+        # description HTML is bulky, so it goes to a gzipped JSONL sidecar instead of the CSV
+        descs: Optional[gzip.GzipFile] = None
+        if descs_path:
+            descs = stack.enter_context(gzip.open(descs_path, "wb", compresslevel=6))
+
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+
+        # crawl tasks hand finished pages (rows + description lines) to the single writer below
+        queue: asyncio.Queue[Optional[Tuple[List[Tuple[Any, ...]], List[bytes]]]] = asyncio.Queue()
+
+        async def crawl(client: httpx.AsyncClient, area: str, w_from: Optional[str], w_to: Optional[str]) -> int:
+            skipped = 0
+            async for items in iter_vacancy_pages(
+                client,
+                sem,
+                pacer,
+                query_text=args.text,
+                area=area,
+                per_page=args.per_page,
+                date_from=w_from,
+                date_to=w_to,
+                max_pages=args.max_pages,
+                employment_filters=args_employment,
+                schedule_filters=args_schedule,
+                only_with_salary=args.only_with_salary,
+                search_fields=args_search_field,
+            ):
+                page_items: List[Vacancy] = []
+                for item in items:
+                    if item.id:
+                        if item.id in seen:
+                            skipped += 1
+                            continue
+                        seen.add(item.id)
+                    page_items.append(item)
+                details: List[Optional[Dict[str, Any]]] = [None] * len(page_items)
+                desc_lines: List[bytes] = []
+                if args.details:
+                    # one batch of concurrent detail calls per page, bounded by the semaphore
+                    details = await fetch_details(client, sem, pacer, page_items, cache=detail_cache)
+                    if descs is not None:
+                        desc_lines = [
+                            dumps_line({"id": item.id, "html": detail["description"]})
+                            for item, detail in zip(page_items, details)
+                            if detail and detail.get("description")
+                        ]
+                rows = [flatten_item(item, detail=detail_obj) for item, detail_obj in zip(page_items, details)]
+                await queue.put((rows, desc_lines))
+            return skipped
+
+        async with make_client(args.user_agent, limit=max(16, concurrency)) as client:
+            # every (area, window) pair is an independent crawl; they share only the client,
+            # semaphore and pacer, so they all run at once
+            tasks = [
+                asyncio.ensure_future(crawl(client, area, w_from, w_to))
+                for area in area_ids
+                for (w_from, w_to) in windows
+            ]
+            # gather finishes when all crawls succeed or as soon as one fails
+            jobs = asyncio.gather(*tasks)
+            jobs.add_done_callback(lambda _: queue.put_nowait(None))
+            try:
+                while (page := await queue.get()) is not None:
+                    rows, desc_lines = page
+                    writer.writerows(rows)
+                    if pq_writer is not None:
+                        pq_writer.write_rows(rows)
+                    if descs is not None and desc_lines:
+                        descs.writelines(desc_lines)
+                    total += len(rows)
+                    f.flush()
+                dupes = sum(await jobs)
+            except BaseException:
+                # a failed crawl or writer aborts the run: stop the remaining crawls and
+                # let them unwind before the client is closed
+                for task in tasks:
+                    task.cancel()
+                jobs.cancel()
+                # retrieve every outcome, including the outer gather's, so nothing is left unobserved
+                await asyncio.gather(jobs, *tasks, return_exceptions=True)
+                raise
+    print(f"Saved {total} rows to {out_path} (deduped {dupes})")
+    if descs is not None:
+        print(f"Saved descriptions to {descs_path}")
+
+    if pq_writer is not None:
         print(f"Saved Parquet to {parquet_path}")
 
 
+def main() -> None:
+    asyncio.run(run())
+
+
 if __name__ == "__main__":
     main()
 